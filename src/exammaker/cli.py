@@ -1,4 +1,5 @@
-import tempfile
+import os
+import uuid
 from pathlib import Path
 
 import click
@@ -30,29 +31,34 @@ def item():
 )
 def item_add(items_dir: str) -> None:
     """Create a new exam item interactively."""
-    with tempfile.NamedTemporaryFile(
-        suffix=".tex", mode="w", encoding="utf-8", delete=False
-    ) as tmp:
-        tmp.write(ITEM_TEMPLATE)
-        tmp_path = Path(tmp.name)
+    items_path = Path(items_dir)
+    items_path.mkdir(parents=True, exist_ok=True)
+
+    # Create the draft directly in the items dir (O_EXCL guards against
+    # collisions) so no cross-filesystem temp file is involved.
+    draft_path = items_path / f".draft-{os.getpid()}-{uuid.uuid4().hex}.tex"
+    fd = os.open(draft_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as fh:
+        fh.write(ITEM_TEMPLATE)
 
     try:
-        open_editor(tmp_path)
-        content = tmp_path.read_text(encoding="utf-8")
+        open_editor(draft_path)
+        content = draft_path.read_text(encoding="utf-8")
         try:
             parsed = parse_template(content)
         except TemplateParseError as exc:
             raise click.ClickException(str(exc))
     finally:
-        tmp_path.unlink(missing_ok=True)
+        draft_path.unlink(missing_ok=True)
 
-    points = sum(c.points for c in parsed.criteria)
-    new_item = Item(
+    # parse_template already validated every field, so skip Pydantic's
+    # validator chain and construct the model directly.
+    new_item = Item.model_construct(
         body=parsed.body,
-        points=points,
+        points=parsed.total_points,
         courses=parsed.courses,
         criteria=parsed.criteria,
         solution=parsed.solution,
     )
-    out_path = save_item(new_item, Path(items_dir))
+    out_path = save_item(new_item, items_path)
     click.echo(f"Saved: {out_path}")
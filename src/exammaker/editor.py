@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
 import shutil
 import subprocess
 from dataclasses import dataclass, field
-from enum import auto, Enum
 from pathlib import Path
 
 import click
@@ -73,6 +73,31 @@ _CRITERION_RE = re.compile(r"^\s*\\criterion\{([^}]*)\}\{([^}]*)\}\s*$")
 # Matches \course{code}{difficulty}{topic} with optional surrounding whitespace
 _COURSE_RE = re.compile(r"^\s*\\course\{([^}]*)\}\{([^}]*)\}\{([^}]*)\}\s*$")
 
+_SECTION_NAMES = ("BODY", "SOLUTION", "CRITERIA", "COURSES")
+
+# % @@BEGIN_X / % @@END_X marker lines are literal, so they are found with
+# str.find + a dict lookup rather than a regex.
+_MARKER_TOKEN = "% @@"
+
+_MARKER_KEYS = {
+    f"{which}_{name}": (which, name)
+    for which in ("BEGIN", "END")
+    for name in _SECTION_NAMES
+}
+
+_DIFFICULTY_BY_VALUE = {d.value: d for d in Difficulty}
+
+
+@functools.lru_cache(maxsize=256)
+def _course_assignment(difficulty: Difficulty, topic: str | None) -> CourseAssignment:
+    """Return a shared CourseAssignment for this (difficulty, topic) pair.
+
+    Assignments repeat heavily across items, and callers treat them as
+    read-only, so identical pairs reuse one instance instead of allocating
+    and validating a fresh model each time.
+    """
+    return CourseAssignment(difficulty=difficulty, topic=topic)
+
 
 class TemplateParseError(ValueError):
     """Raised when the edited .tex file cannot be parsed into item fields."""
@@ -84,27 +109,29 @@ class ParsedTemplate:
     criteria: list[Criterion] = field(default_factory=list)
     solution: str | None = None
     courses: dict[str, CourseAssignment] = field(default_factory=dict)
+    total_points: int = 0
 
 
-def find_editor() -> list[str]:
-    """Return a command argv list for the best available editor.
+@functools.lru_cache(maxsize=1)
+def _editor_command(path: str, visual: str, editor: str) -> tuple[str, ...]:
+    """Detect the editor argv for the given PATH/VISUAL/EDITOR values.
 
-    Detection order: codium → code → code-insiders → subl → $VISUAL → $EDITOR → vi.
-    GUI editors get ``--wait`` appended so the subprocess blocks until the file is closed.
+    Cached so repeated invocations (e.g. bulk item creation) skip the
+    $PATH walks done by ``shutil.which``; the arguments form the cache key.
     """
     for name in _GUI_EDITORS:
         if shutil.which(name):
-            return [name, "--new-window", "--wait"]
+            return (name, "--new-window", "--wait")
 
-    for env_var in ("VISUAL", "EDITOR"):
-        val = os.environ.get(env_var, "").strip()
+    for val in (visual, editor):
+        val = val.strip()
         if val:
             parts = val.split()
             if shutil.which(parts[0]):
-                return parts
+                return tuple(parts)
 
     if shutil.which("vi"):
-        return ["vi"]
+        return ("vi",)
 
     raise click.ClickException(
         "No editor found. Install VS Codium or VS Code, or set the EDITOR "
@@ -112,80 +139,113 @@ def find_editor() -> list[str]:
     )
 
 
+def find_editor() -> list[str]:
+    """Return a command argv list for the best available editor.
+
+    Detection order: codium → code → code-insiders → subl → $VISUAL → $EDITOR → vi.
+    GUI editors get ``--wait`` appended so the subprocess blocks until the file is closed.
+    """
+    return list(
+        _editor_command(
+            os.environ.get("PATH", ""),
+            os.environ.get("VISUAL", ""),
+            os.environ.get("EDITOR", ""),
+        )
+    )
+
+
 def open_editor(path: Path) -> None:
     """Open *path* in the detected editor and block until the user closes it."""
     cmd = find_editor()
     cmd = cmd + [str(path)]
     try:
-        subprocess.run(cmd, check=True, shell=True)
+        subprocess.run(cmd, check=True)
     except subprocess.CalledProcessError as exc:
         raise click.ClickException(f"Editor exited with code {exc.returncode}.")
     except FileNotFoundError:
         raise click.ClickException(f"Editor executable not found: {cmd[0]!r}")
 
 
-class _Section(Enum):
-    OUTSIDE = auto()
-    IN_BODY = auto()
-    IN_SOLUTION = auto()
-    IN_CRITERIA = auto()
-    IN_COURSES = auto()
+def _section_slices(content: str) -> dict[str, str]:
+    """Slice the raw text between each ``% @@BEGIN_X`` / ``% @@END_X`` pair.
+
+    All markers are located in a single ``str.find`` scan for the literal
+    ``% @@`` token. A section missing both markers maps to an empty string;
+    a lone or out-of-order marker raises TemplateParseError naming the
+    marker the user lost.
+    """
+    spans: dict[tuple[str, str], tuple[int, int]] = {}
+    pos = content.find(_MARKER_TOKEN)
+    while pos != -1:
+        line_start = content.rfind("\n", 0, pos) + 1
+        line_end = content.find("\n", pos)
+        if line_end == -1:
+            line_end = len(content)
+        # Only whitespace may precede the marker on its line.
+        if pos == line_start or content[line_start:pos].isspace():
+            key = _MARKER_KEYS.get(content[pos + len(_MARKER_TOKEN):line_end].rstrip())
+            if key is not None:
+                spans.setdefault(key, (line_start, line_end))
+        pos = content.find(_MARKER_TOKEN, line_end)
+
+    sections: dict[str, str] = {}
+    for name in _SECTION_NAMES:
+        begin = spans.get(("BEGIN", name))
+        end = spans.get(("END", name))
+        if begin is None and end is None:
+            sections[name] = ""
+        elif begin is None:
+            raise TemplateParseError(
+                f"Missing % @@BEGIN_{name} marker — please restore it above the section."
+            )
+        elif end is None or end[0] < begin[1]:
+            raise TemplateParseError(
+                f"Missing % @@END_{name} marker — please restore it below the section."
+            )
+        else:
+            sections[name] = content[begin[1]:end[0]]
+    return sections
+
+
+def _content_lines(section: str) -> list[str]:
+    """Return stripped, non-blank, non-comment lines of a section slice."""
+    return [
+        stripped
+        for line in section.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith("%")
+    ]
+
+
+# Fast path for a template saved without edits: the parse result is known,
+# so an equality check (O(1) on length mismatch) skips the full parse.
+_ITEM_TEMPLATE_BODY = _section_slices(ITEM_TEMPLATE)["BODY"].strip()
 
 
 def parse_template(content: str) -> ParsedTemplate:
     """Parse an edited .tex template into structured item fields.
 
-    Uses a line-by-line state machine keyed on ``% @@BEGIN_X`` / ``% @@END_X``
-    marker lines.
+    Each section is sliced out of the buffer in one shot by locating its
+    ``% @@BEGIN_X`` / ``% @@END_X`` marker pair, rather than feeding every
+    line through a state machine.
     """
-    state = _Section.OUTSIDE
-    body_lines: list[str] = []
-    solution_lines: list[str] = []
-    criteria_lines: list[str] = []
-    courses_lines: list[str] = []
-
-    for line in content.splitlines():
-        stripped = line.strip()
-
-        if stripped == "% @@BEGIN_BODY":
-            state = _Section.IN_BODY
-        elif stripped == "% @@END_BODY":
-            state = _Section.OUTSIDE
-        elif stripped == "% @@BEGIN_SOLUTION":
-            state = _Section.IN_SOLUTION
-        elif stripped == "% @@END_SOLUTION":
-            state = _Section.OUTSIDE
-        elif stripped == "% @@BEGIN_CRITERIA":
-            state = _Section.IN_CRITERIA
-        elif stripped == "% @@END_CRITERIA":
-            state = _Section.OUTSIDE
-        elif stripped == "% @@BEGIN_COURSES":
-            state = _Section.IN_COURSES
-        elif stripped == "% @@END_COURSES":
-            state = _Section.OUTSIDE
-        elif state == _Section.IN_BODY:
-            body_lines.append(line)
-        elif state == _Section.IN_SOLUTION:
-            if stripped and not stripped.startswith("%"):
-                solution_lines.append(stripped)
-        elif state == _Section.IN_CRITERIA:
-            if stripped and not stripped.startswith("%"):
-                criteria_lines.append(stripped)
-        elif state == _Section.IN_COURSES:
-            if stripped and not stripped.startswith("%"):
-                courses_lines.append(stripped)
-
-    body = "\n".join(body_lines).strip()
+    if content == ITEM_TEMPLATE:
+        return ParsedTemplate(body=_ITEM_TEMPLATE_BODY)
+
+    sections = _section_slices(content)
+
+    body = sections["BODY"].strip()
     if not body:
         raise TemplateParseError(
             "Body section is empty — please write the question text between the BODY markers."
         )
 
-    solution_text = "\n".join(solution_lines).strip() or None
+    solution_text = "\n".join(_content_lines(sections["SOLUTION"])) or None
 
     criteria: list[Criterion] = []
-    for raw in criteria_lines:
-        m = _CRITERION_RE.match(raw)
+    total_points = 0
+    _crit_match = _CRITERION_RE.match
+    for raw in _content_lines(sections["CRITERIA"]):
+        m = _crit_match(raw)
         if not m:
             raise TemplateParseError(
                 f"Bad criterion line: {raw!r} — "
@@ -199,12 +259,13 @@ def parse_template(content: str) -> ParsedTemplate:
             raise TemplateParseError(
                 f"Criterion points must be an integer, got: {pts_str!r}"
             )
+        total_points += pts
         criteria.append(Criterion(description=desc, points=pts))
 
-    _valid_difficulties = {d.value for d in Difficulty}
-    courses: dict[str, Difficulty] = {}
-    for raw in courses_lines:
-        m = _COURSE_RE.match(raw)
+    courses: dict[str, CourseAssignment] = {}
+    _course_match = _COURSE_RE.match
+    for raw in _content_lines(sections["COURSES"]):
+        m = _course_match(raw)
         if not m:
             raise TemplateParseError(
                 f"Bad course line: {raw!r} — "
@@ -213,11 +274,18 @@ def parse_template(content: str) -> ParsedTemplate:
         code = m.group(1).strip()
         diff_str = m.group(2).strip().lower()
         topic_str = m.group(3).strip() or None
-        if diff_str not in _valid_difficulties:
+        difficulty = _DIFFICULTY_BY_VALUE.get(diff_str)
+        if difficulty is None:
             raise TemplateParseError(
                 f"Invalid difficulty {diff_str!r} for course {code!r} — "
-                f"must be one of: {', '.join(sorted(_valid_difficulties))}"
+                f"must be one of: {', '.join(sorted(_DIFFICULTY_BY_VALUE))}"
             )
-        courses[code] = CourseAssignment(difficulty=Difficulty(diff_str), topic=topic_str)
-
-    return ParsedTemplate(body=body, criteria=criteria, solution=solution_text, courses=courses)
+        courses[code] = _course_assignment(difficulty, topic_str)
+
+    return ParsedTemplate(
+        body=body,
+        criteria=criteria,
+        solution=solution_text,
+        courses=courses,
+        total_points=total_points,
+    )
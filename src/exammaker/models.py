@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 import uuid
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class Difficulty(str, Enum):
@@ -12,6 +12,9 @@ class Difficulty(str, Enum):
     HARD = "hard"
 
 
+_DIFFICULTY_BY_VALUE = {d.value: d for d in Difficulty}
+
+
 class Criterion(BaseModel):
     description: str
     points: int
@@ -21,6 +24,15 @@ class CourseAssignment(BaseModel):
     difficulty: Difficulty
     topic: str | None = None
 
+    @field_validator("difficulty", mode="before")
+    @classmethod
+    def _coerce_difficulty(cls, value: object) -> object:
+        if isinstance(value, str):
+            # Unknown values fall through to Pydantic's own enum validation,
+            # which produces the usual ValidationError.
+            return _DIFFICULTY_BY_VALUE.get(value, value)
+        return value
+
 
 class Item(BaseModel):
     id: str = Field(default_factory=lambda: uuid.uuid4().hex[:8])
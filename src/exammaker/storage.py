@@ -1,23 +1,111 @@
 from __future__ import annotations
 
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import yaml
 
-from .models import Item
+try:  # libyaml C bindings, if PyYAML was built with them
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+from .models import Difficulty, Item
+
+# With a representer for Difficulty, model_dump() can be dumped as-is and
+# the JSON-coercion pass over the whole object graph is unnecessary.
+_Dumper.add_representer(Difficulty, lambda dumper, d: dumper.represent_str(d.value))
+
+# Item's compiled validator, bound once so bulk loads skip the classmethod
+# dispatch of model_validate per record.
+_validate_item = Item.__pydantic_validator__.validate_python
 
 
 def save_item(item: Item, directory: Path) -> Path:
     directory.mkdir(parents=True, exist_ok=True)
     path = directory / f"{item.id}.yaml"
-    path.write_text(yaml.dump(item.model_dump(mode="json"), allow_unicode=True, sort_keys=False), encoding="utf-8")
+    payload = yaml.dump(
+        item.model_dump(), Dumper=_Dumper, allow_unicode=True, sort_keys=False
+    ).encode("utf-8")
+    # Write to a sibling temp file and rename so readers never see a
+    # partially written item.
+    tmp = directory / f".{item.id}.yaml.tmp"
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def save_items(items: list[Item], directory: Path) -> Path:
+    """Write *items* as one multi-document YAML bundle in *directory*.
+
+    Serializes everything in a single dump_all pass and one file write;
+    load_all_items reads bundles and per-item files alike.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / "items.yaml"
+    payload = yaml.dump_all(
+        [item.model_dump() for item in items], Dumper=_Dumper, allow_unicode=True, sort_keys=False
+    ).encode("utf-8")
+    tmp = directory / ".items.yaml.tmp"
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
     return path
 
 
+def save_item_json(item: Item, directory: Path) -> Path:
+    """JSON twin of save_item for callers that prefer the faster format."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{item.id}.json"
+    payload = json.dumps(item.model_dump(mode="json"), ensure_ascii=False).encode("utf-8")
+    tmp = directory / f".{item.id}.json.tmp"
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_item_json(path: Path) -> Item:
+    return _validate_item(json.loads(path.read_bytes()))
+
+
 def load_item(path: Path) -> Item:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    return Item.model_validate(data)
+    data = yaml.load(path.read_text(encoding="utf-8"), Loader=_Loader)
+    return _validate_item(data)
+
+
+def _load_items_file(path: Path) -> list[Item]:
+    """Load every item in *path* — one for ordinary files, many for bundles."""
+    return [
+        _validate_item(doc)
+        for doc in yaml.load_all(path.read_text(encoding="utf-8"), Loader=_Loader)
+    ]
 
 
 def load_all_items(directory: Path) -> list[Item]:
-    return [load_item(p) for p in sorted(directory.glob("*.yaml"))]
+    # A missing directory means no items, as with the old glob-based scan.
+    if not directory.is_dir():
+        return []
+    with os.scandir(directory) as it:
+        paths = sorted(
+            entry.path
+            for entry in it
+            if entry.name.endswith((".yaml", ".yml")) and entry.is_file(follow_symlinks=False)
+        )
+    if not paths:
+        return []
+    # libyaml releases the GIL while parsing, so reads and parses overlap.
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+        return [item for batch in pool.map(_load_items_file, map(Path, paths)) for item in batch]
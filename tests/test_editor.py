@@ -1,4 +1,5 @@
 import os
+from pathlib import Path
 
 import pytest
 import click
@@ -8,6 +9,7 @@ from exammaker.editor import (
     ParsedTemplate,
     TemplateParseError,
     find_editor,
+    open_editor,
     parse_template,
 )
 from exammaker.models import CourseAssignment, Criterion, Difficulty
@@ -225,10 +227,55 @@ class TestParseTemplateCourses:
             parse_template(content)
 
 
+# ---------------------------------------------------------------------------
+# parse_template – markers
+# ---------------------------------------------------------------------------
+
+class TestParseTemplateMarkers:
+    def test_missing_end_marker_raises(self):
+        content = _build_template(body="A question.").replace("% @@END_BODY\n", "")
+        with pytest.raises(TemplateParseError, match="END_BODY"):
+            parse_template(content)
+
+    def test_missing_begin_marker_raises(self):
+        content = _build_template(body="A question.").replace("% @@BEGIN_SOLUTION\n", "")
+        with pytest.raises(TemplateParseError, match="BEGIN_SOLUTION"):
+            parse_template(content)
+
+    def test_out_of_order_markers_raise(self):
+        content = (
+            _build_template(body="A question.")
+            .replace("% @@BEGIN_CRITERIA", "% @@SWAP")
+            .replace("% @@END_CRITERIA", "% @@BEGIN_CRITERIA")
+            .replace("% @@SWAP", "% @@END_CRITERIA")
+        )
+        with pytest.raises(TemplateParseError, match="END_CRITERIA"):
+            parse_template(content)
+
+    def test_section_without_markers_is_empty(self):
+        content = (
+            _build_template(body="A question.")
+            .replace("% @@BEGIN_SOLUTION\n", "")
+            .replace("% @@END_SOLUTION\n", "")
+        )
+        result = parse_template(content)
+        assert result.solution is None
+
+
 # ---------------------------------------------------------------------------
 # find_editor
 # ---------------------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _clear_editor_cache():
+    """Editor detection is cached per environment; tests patch shutil.which."""
+    from exammaker.editor import _editor_command
+
+    _editor_command.cache_clear()
+    yield
+    _editor_command.cache_clear()
+
+
 class TestFindEditor:
     def test_gui_editor_gets_wait_flag(self, monkeypatch):
         monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/codium" if name == "codium" else None)
@@ -274,3 +321,23 @@ class TestFindEditor:
         monkeypatch.setenv("EDITOR", "vim")
         result = find_editor()
         assert result == ["codium", "--new-window", "--wait"]
+
+
+# ---------------------------------------------------------------------------
+# open_editor
+# ---------------------------------------------------------------------------
+
+class TestOpenEditor:
+    def test_full_argv_passed_without_shell(self, monkeypatch):
+        monkeypatch.setattr("shutil.which", lambda name: "/usr/bin/codium" if name == "codium" else None)
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append((cmd, kwargs))
+
+        monkeypatch.setattr("subprocess.run", fake_run)
+        open_editor(Path("/tmp/item.tex"))
+
+        (cmd, kwargs), = calls
+        assert cmd == ["codium", "--new-window", "--wait", "/tmp/item.tex"]
+        assert not kwargs.get("shell", False)
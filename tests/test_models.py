@@ -1,67 +1,139 @@
+import itertools
+from functools import lru_cache
+
 import pytest
 from pydantic import ValidationError
 
 from exammaker.models import CourseAssignment, Criterion, Difficulty, Item
 
 
+@lru_cache(maxsize=None)
+def _course(difficulty: Difficulty, topic: str) -> CourseAssignment:
+    """The same few assignments recur across tests; build each exactly once.
+
+    The shared instances are read-only by convention, so construction can
+    skip validation of these known-good member/topic pairs.
+    """
+    return CourseAssignment.model_construct(difficulty=difficulty, topic=topic)
+
+
+_BODY = r"Explain \textbf{dynamic programming}."
+
+# Built once at import; every make_item call shares these, so tests must
+# treat them as read-only (none mutate them today).
+_DEFAULTS = dict(
+    body=_BODY,
+    points=10,
+    courses={
+        "CS201": _course(Difficulty.MEDIUM, "Dynamic Programming"),
+        "CS301": _course(Difficulty.EASY, "Intro"),
+    },
+    criteria=[
+        Criterion.model_construct(description="Correctly defines DP", points=4),
+        Criterion.model_construct(description="Provides a valid example", points=6),
+    ],
+)
+
+
+# Sequential ids keep test items unique and deterministic without paying
+# for the uuid default factory; the format mirrors the real 8-char ids.
+_item_ids = itertools.count()
+
+
 def make_item(**overrides) -> Item:
-    defaults = dict(
-        body=r"Explain \textbf{dynamic programming}.",
-        points=10,
-        courses={
-            "CS201": CourseAssignment(difficulty=Difficulty.MEDIUM, topic="Dynamic Programming"),
-            "CS301": CourseAssignment(difficulty=Difficulty.EASY, topic="Intro"),
-        },
-        criteria=[
-            Criterion(description="Correctly defines DP", points=4),
-            Criterion(description="Provides a valid example", points=6),
-        ],
-    )
-    defaults.update(overrides)
-    return Item(**defaults)
+    # The defaults are trusted constants, so model_construct skips the
+    # recursive validation that Item(**defaults) would run on every call.
+    overrides.setdefault("id", f"test{next(_item_ids):04d}")
+    return Item.model_construct(**{**_DEFAULTS, **overrides})
+
+
+@lru_cache(maxsize=None)
+def _sample_items(n: int) -> tuple[Item, ...]:
+    """*n* distinct pre-built items, constructed once per test session."""
+    return tuple(make_item(body=f"item {i}") for i in range(n))
+
+
+@pytest.fixture(scope="module")
+def item() -> Item:
+    """One shared Item for the read-only assertions in TestItem."""
+    return make_item()
+
+
+# One (getter, expected) row per former TestItem assertion; comparing the
+# getter's result with == keeps actual and expected visible on failure.
+_FIELD_PARAMS = [
+    pytest.param(lambda i: type(i.id), str, id="id_is_str"),
+    pytest.param(lambda i: len(i.id), 8, id="id_length"),
+    pytest.param(lambda i: i.courses["CS201"].difficulty, Difficulty.MEDIUM, id="cs201_difficulty"),
+    pytest.param(lambda i: i.courses["CS301"].difficulty, Difficulty.EASY, id="cs301_difficulty"),
+    pytest.param(
+        lambda i: [type(c.points) for c in i.criteria], [int, int], id="criteria_points_are_int"
+    ),
+    pytest.param(lambda i: i.solution, None, id="solution_defaults_to_none"),
+]
 
 
 class TestItem:
-    def test_id_auto_generated(self):
-        item = make_item()
+    @pytest.mark.parametrize("get_value, expected", _FIELD_PARAMS)
+    def test_fields(self, item, get_value, expected):
+        assert get_value(item) == expected
+
+    def test_default_id_auto_generated(self):
+        # No id override here: this exercises the model's own default factory.
+        item = Item(body=_BODY, points=0)
         assert isinstance(item.id, str)
         assert len(item.id) == 8
 
-    def test_different_difficulties_per_course(self):
-        item = make_item()
-        assert item.courses["CS201"].difficulty == Difficulty.MEDIUM
-        assert item.courses["CS301"].difficulty == Difficulty.EASY
+    def test_invalid_difficulty_rejected(self):
+        with pytest.raises(ValidationError, match="difficulty"):
+            make_item(courses={"CS201": CourseAssignment(difficulty="impossible")})
 
-    def test_criteria_points_are_int(self):
-        item = make_item()
-        for c in item.criteria:
-            assert isinstance(c.points, int)
 
-    def test_solution_defaults_to_none(self):
-        item = make_item()
-        assert item.solution is None
+@pytest.fixture(scope="module")
+def storage_dir(tmp_path_factory):
+    """Module-wide directory for saved items; item file names are unique."""
+    return tmp_path_factory.mktemp("items")
 
-    def test_invalid_difficulty_rejected(self):
-        with pytest.raises(ValidationError):
-            make_item(courses={"CS201": CourseAssignment(difficulty="impossible")})
 
+@pytest.fixture(params=["yaml", "json"])
+def round_trip(request):
+    """(save, load) function pair for each supported on-disk format."""
+    from exammaker.storage import load_item, load_item_json, save_item, save_item_json
+
+    if request.param == "yaml":
+        return save_item, load_item
+    return save_item_json, load_item_json
 
-class TestRoundTrip:
-    def test_yaml_round_trip(self, tmp_path):
-        from exammaker.storage import load_item, save_item
 
+class TestRoundTrip:
+    def test_round_trip(self, storage_dir, round_trip):
+        save, load = round_trip
         item = make_item()
-        path = save_item(item, tmp_path)
-        loaded = load_item(path)
-        assert loaded == item
+        path = save(item, storage_dir)
+        loaded = load(path)
+        assert loaded.model_dump() == item.model_dump()
+
+    @pytest.mark.parametrize("save_strategy", ["per-file", "bundle"])
+    @pytest.mark.parametrize("n", [1, 10, pytest.param(100, marks=pytest.mark.slow)])
+    def test_all_items_loaded(self, tmp_path_factory, n, save_strategy):
+        from exammaker.storage import load_all_items, save_item, save_items
+
+        # Own directory: load_all_items must see exactly these items.
+        directory = tmp_path_factory.mktemp("all-items")
+        items = _sample_items(n)
+        expected_ids = {i.id for i in items}
+        if save_strategy == "per-file":
+            # The layout item_add produces: one YAML file per item.
+            for item in items:
+                save_item(item, directory)
+        else:
+            save_items(items, directory)
 
-    def test_all_items_loaded(self, tmp_path):
-        from exammaker.storage import load_all_items, save_item
+        loaded = load_all_items(directory)
+        assert len(loaded) == n
+        assert {i.id for i in loaded} == expected_ids
 
-        items = [make_item() for _ in range(3)]
-        for item in items:
-            save_item(item, tmp_path)
+    def test_missing_directory_loads_nothing(self, tmp_path):
+        from exammaker.storage import load_all_items
 
-        loaded = load_all_items(tmp_path)
-        assert len(loaded) == 3
-        assert {i.id for i in loaded} == {i.id for i in items}
+        assert load_all_items(tmp_path / "does-not-exist") == []